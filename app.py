@@ -1,40 +1,58 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 import requests
 import os
-from dotenv import load_dotenv
-from datetime import datetime
-
-# Load environment variables from .env file
-load_dotenv()
+from hedging import hedged_get
+from insights import (
+    AVAILABLE_ENDPOINTS, EXPORT_MIMETYPES, HEDGE_ENABLED, YOUTUBE_API_KEY, YOUTUBE_CHANNELS_URL,
+    apply_batch_response, apply_fetch_error, apply_youtube_response, batch_hedge_policy,
+    dashboard_payload, health_payload, hedge_policy, home_payload, new_creator_payload,
+    parse_youtube_ids, snapshot_store, upstream_chunks, youtube_params
+)
 
 app = Flask(__name__)
 
+def fetch_youtube(youtube_ids, policy=hedge_policy):
+    """Call channels.list for one id or a comma separated list of ids"""
+    if HEDGE_ENABLED:
+        return hedged_get(policy, YOUTUBE_CHANNELS_URL, youtube_params(youtube_ids), timeout=10)
+    return requests.get(YOUTUBE_CHANNELS_URL, params=youtube_params(youtube_ids), timeout=10)
 
-# Get API key from environment variable
-YOUTUBE_API_KEY = os.environ.get('YOUTUBE_API_KEY')
+def fetch_error_message(error):
+    """
+    Error text for a failed upstream call. Transport errors get fixed
+    messages: their text differs between requests and httpx, and the
+    request URL in it would leak the API key.
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return "YouTube API request timed out"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return "Failed to fetch data: connection error"
+    if isinstance(error, requests.exceptions.JSONDecodeError):
+        return f"Failed to fetch data: {str(error)}"
+    if isinstance(error, requests.exceptions.RequestException):
+        return "Failed to fetch data: request error"
+    return f"Unexpected error: {str(error)}"
+
+def fetch_channel_chunk(payloads):
+    """Fill the payloads of up to 50 channels from a single upstream call"""
+    try:
+        youtube_ids = ','.join(payload['requested_youtube_id'] for payload in payloads)
+        youtube_response = fetch_youtube(youtube_ids, batch_hedge_policy)
+        apply_batch_response(payloads, youtube_response.status_code, youtube_response.json())
+    except Exception as e:
+        for payload in payloads:
+            apply_fetch_error(payload, fetch_error_message(e))
+    return payloads
 
 @app.route('/')
 def home():
     """Home page with API information"""
-    return jsonify({
-        "message": "Creator Insight API is running!",
-        "status": "healthy",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "creator_data": "/creator?youtube_id=CHANNEL_ID"
-        },
-        "documentation": "Visit /creator?youtube_id=UC9gFih9rw0zNCK3ZtoKQQyA for example usage"
-    })
+    return jsonify(home_payload())
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Simple health check endpoint"""
-    return jsonify({
-        "status": "healthy", 
-        "service": "Creator Insight API",
-        "timestamp": datetime.now().isoformat()
-    })
+    return jsonify(health_payload())
 
 @app.route('/creator', methods=['GET'])
 def get_creator_insights():
@@ -49,74 +67,46 @@ def get_creator_insights():
     if not youtube_id:
         return jsonify({"error": "Missing required parameter 'youtube_id'"}), 400
 
-    aggregated_data = {
-        "requested_youtube_id": youtube_id,
-        "youtube_data": {},
-        "summary": {},
-        "status": "success",
-        "timestamp": datetime.now().isoformat()
-    }
+    aggregated_data = new_creator_payload(youtube_id)
 
     # 2. Check if we have an API key
     if not YOUTUBE_API_KEY:
-        aggregated_data["youtube_data"] = {"error": "YouTube API key not configured"}
-        aggregated_data["status"] = "partial"
         return jsonify(aggregated_data)
 
     # 3. FETCH DATA FROM YOUTUBE API
     try:
-        youtube_url = "https://www.googleapis.com/youtube/v3/channels"
-        youtube_params = {
-            'part': 'statistics,snippet',
-            'id': youtube_id,
-            'key': YOUTUBE_API_KEY
-        }
-        
-        youtube_response = requests.get(youtube_url, params=youtube_params, timeout=10)
-        youtube_data = youtube_response.json()
-
-        # 4. Check if we got a successful response
-        if youtube_response.status_code != 200:
-            aggregated_data["youtube_data"] = {
-                "error": f"YouTube API returned error: {youtube_data.get('error', {}).get('message', 'Unknown error')}"
-            }
-            aggregated_data["status"] = "error"
-            return jsonify(aggregated_data)
-
-        # 5. PARSE & TRANSFORM the data
-        if youtube_data.get('items'):
-            channel_data = youtube_data['items'][0]
-            aggregated_data['youtube_data'] = {
-                "channel_title": channel_data['snippet']['title'],
-                "description": channel_data['snippet']['description'][:200] + "..." if len(channel_data['snippet']['description']) > 200 else channel_data['snippet']['description'],
-                "subscriber_count": int(channel_data['statistics'].get('subscriberCount', 0)),
-                "video_count": int(channel_data['statistics'].get('videoCount', 0)),
-                "view_count": int(channel_data['statistics'].get('viewCount', 0))
-            }
-            
-            # Build a simple summary
-            aggregated_data['summary'] = {
-                "platforms": ['YouTube'],
-                "total_videos": aggregated_data['youtube_data']['video_count'],
-                "total_subscribers": aggregated_data['youtube_data']['subscriber_count']
-            }
-        else:
-            aggregated_data["youtube_data"] = {"error": "No channel found with this ID"}
-            aggregated_data["status"] = "error"
-
-    except requests.exceptions.Timeout:
-        aggregated_data["youtube_data"] = {"error": "YouTube API request timed out"}
-        aggregated_data["status"] = "error"
-    except requests.exceptions.RequestException as e:
-        aggregated_data["youtube_data"] = {"error": f"Failed to fetch data: {str(e)}"}
-        aggregated_data["status"] = "error"
+        youtube_response = fetch_youtube(youtube_id)
+
+        # 4. PARSE & TRANSFORM the data
+        apply_youtube_response(aggregated_data, youtube_response.status_code, youtube_response.json())
+
     except Exception as e:
-        aggregated_data["youtube_data"] = {"error": f"Unexpected error: {str(e)}"}
-        aggregated_data["status"] = "error"
+        apply_fetch_error(aggregated_data, fetch_error_message(e))
 
-    # 6. RETURN A UNIFIED JSON RESPONSE
+    # 5. RETURN A UNIFIED JSON RESPONSE
     return jsonify(aggregated_data)
 
+@app.route('/creators', methods=['GET'])
+def get_creators_insights():
+    """
+    Aggregates data for many channels, one /creator payload per id.
+    Query parameters:
+    - youtube_ids (string, required): Comma separated channel IDs (max 500).
+    """
+    try:
+        youtube_ids = parse_youtube_ids(request.args.get('youtube_ids'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    payloads = [new_creator_payload(youtube_id) for youtube_id in youtube_ids]
+
+    # Upstream calls run one chunk after another in sync mode
+    if YOUTUBE_API_KEY:
+        for chunk in upstream_chunks(payloads):
+            fetch_channel_chunk(chunk)
+
+    return jsonify({"creators": payloads})
+
 @app.route('/dashboard-stats', methods=['GET'])
 def get_dashboard_stats():
     """
@@ -130,32 +120,48 @@ def get_dashboard_stats():
     # Get the basic data using existing function
     basic_data = get_creator_insights().get_json()
     
-    # Enhance with additional calculated metrics for dashboard
-    if basic_data.get('status') == 'success' and basic_data.get('youtube_data'):
-        yt_data = basic_data['youtube_data']
-        
-        # Calculate additional metrics
-        subscribers = yt_data.get('subscriber_count', 0)
-        views = yt_data.get('view_count', 0)
-        videos = yt_data.get('video_count', 1)
-        
-        enhanced_data = {
-            **basic_data,
-            "dashboard_metrics": {
-                "views_per_subscriber": views / subscribers if subscribers > 0 else 0,
-                "views_per_video": views / videos if videos > 0 else 0,
-                "engagement_score": min(100, (subscribers / max(1, views)) * 100000),
-                "content_frequency_score": min(100, videos / 100)
-            }
-        }
-        
-        return jsonify(enhanced_data)
-    
-    return jsonify(basic_data)
+    return jsonify(dashboard_payload(basic_data))
+
+@app.route('/export', methods=['GET'])
+def export_snapshots():
+    """
+    Streams stored channel snapshots as a file. Reads local data only.
+    Query parameters:
+    - format (string, optional): csv (default), parquet or arrow.
+    - columns (string, optional): Comma separated columns to include.
+    - since / until (string, optional): ISO time range, until exclusive.
+    - latest (bool, optional): Only the newest snapshot per channel.
+    """
+    if not snapshot_store:
+        return jsonify({"error": "Snapshot storage is disabled"}), 503
+
+    # Imported here so startup does not pay for the export module
+    from export import iter_export, parse_columns, parse_timestamp
+
+    export_format = request.args.get('format', 'csv')
+    try:
+        chunks = iter_export(
+            snapshot_store,
+            export_format,
+            columns=parse_columns(request.args.get('columns')),
+            since=parse_timestamp(request.args.get('since')),
+            until=parse_timestamp(request.args.get('until')),
+            latest=request.args.get('latest', 'false').lower() in ('1', 'true', 'yes')
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 501
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_MIMETYPES[export_format],
+        headers={"Content-Disposition": f"attachment; filename=snapshots.{export_format}"}
+    )
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({"error": "Endpoint not found", "available_endpoints": ["/", "/health", "/creator"]}), 404
+    return jsonify({"error": "Endpoint not found", "available_endpoints": AVAILABLE_ENDPOINTS}), 404
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+
+import httpx
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from async_hedging import async_hedged_get
+from export import iter_export, parse_columns, parse_timestamp
+from insights import (
+    AVAILABLE_ENDPOINTS, EXPORT_MIMETYPES, HEDGE_ENABLED, YOUTUBE_API_KEY, YOUTUBE_CHANNELS_URL,
+    apply_batch_response, apply_fetch_error, apply_youtube_response, batch_hedge_policy,
+    dashboard_payload, health_payload, hedge_policy, home_payload, new_creator_payload,
+    parse_youtube_ids, snapshot_store, upstream_chunks, youtube_params
+)
+
+# Async serving mode with the same routes and response bodies as app.py.
+# Run with: uvicorn asgi_app:app
+
+# Upper bound on concurrent YouTube calls across all in-flight requests
+UPSTREAM_CONCURRENCY = int(os.environ.get('UPSTREAM_CONCURRENCY', 50))
+
+upstream = {}
+
+@asynccontextmanager
+async def lifespan(app):
+    # Each permit can have a hedge in flight next to its first attempt, so
+    # size the pool for both rather than let hedges queue for a connection
+    max_connections = UPSTREAM_CONCURRENCY * 2 if HEDGE_ENABLED else UPSTREAM_CONCURRENCY
+    upstream['client'] = httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        )
+    )
+    upstream['semaphore'] = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+    try:
+        yield
+    finally:
+        await upstream['client'].aclose()
+
+def json_response(data, status_code=200):
+    """Serialize exactly like Flask's jsonify so both modes match byte for byte"""
+    body = json.dumps(data, ensure_ascii=True, sort_keys=True, separators=(",", ":")) + "\n"
+    return Response(body, status_code=status_code, media_type="application/json")
+
+async def fetch_youtube(youtube_ids, policy=hedge_policy):
+    """Call channels.list for one id or a comma separated list of ids"""
+    client = upstream['client']
+    async with upstream['semaphore']:
+        if HEDGE_ENABLED:
+            return await async_hedged_get(policy, client, YOUTUBE_CHANNELS_URL, youtube_params(youtube_ids))
+        return await client.get(YOUTUBE_CHANNELS_URL, params=youtube_params(youtube_ids))
+
+def fetch_error_message(error):
+    """Same messages as app.fetch_error_message, for httpx errors"""
+    if isinstance(error, httpx.TimeoutException):
+        return "YouTube API request timed out"
+    if isinstance(error, httpx.TransportError):
+        return "Failed to fetch data: connection error"
+    if isinstance(error, json.JSONDecodeError):
+        # requests raises this as a RequestException with the same text
+        return f"Failed to fetch data: {str(error)}"
+    if isinstance(error, httpx.HTTPError):
+        return "Failed to fetch data: request error"
+    return f"Unexpected error: {str(error)}"
+
+async def fetch_creator_payload(youtube_id):
+    """Build the /creator payload for one channel"""
+    aggregated_data = new_creator_payload(youtube_id)
+
+    if not YOUTUBE_API_KEY:
+        return aggregated_data
+
+    try:
+        youtube_response = await fetch_youtube(youtube_id)
+
+        # Parsing also writes the snapshot, which must not block the event loop
+        await run_in_threadpool(apply_youtube_response, aggregated_data, youtube_response.status_code, youtube_response.json())
+
+    except Exception as e:
+        apply_fetch_error(aggregated_data, fetch_error_message(e))
+
+    return aggregated_data
+
+async def fetch_channel_chunk(payloads):
+    """Fill the payloads of up to 50 channels from a single upstream call"""
+    try:
+        youtube_ids = ','.join(payload['requested_youtube_id'] for payload in payloads)
+        youtube_response = await fetch_youtube(youtube_ids, batch_hedge_policy)
+        await run_in_threadpool(apply_batch_response, payloads, youtube_response.status_code, youtube_response.json())
+    except Exception as e:
+        for payload in payloads:
+            apply_fetch_error(payload, fetch_error_message(e))
+    return payloads
+
+async def home(request):
+    """Home page with API information"""
+    return json_response(home_payload())
+
+async def health_check(request):
+    """Simple health check endpoint"""
+    return json_response(health_payload())
+
+async def get_creator_insights(request):
+    """
+    Aggregates creator data from YouTube.
+    Query parameters:
+    - youtube_id (string, required): The YouTube channel ID.
+    """
+    youtube_id = request.query_params.get('youtube_id')
+
+    if not youtube_id:
+        return json_response({"error": "Missing required parameter 'youtube_id'"}, 400)
+
+    return json_response(await fetch_creator_payload(youtube_id))
+
+async def get_creators_insights(request):
+    """
+    Aggregates data for many channels, one /creator payload per id.
+    Query parameters:
+    - youtube_ids (string, required): Comma separated channel IDs (max 500).
+    """
+    try:
+        youtube_ids = parse_youtube_ids(request.query_params.get('youtube_ids'))
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
+    payloads = [new_creator_payload(youtube_id) for youtube_id in youtube_ids]
+
+    # Fan out: all chunks are fetched concurrently, bounded by the semaphore
+    if YOUTUBE_API_KEY:
+        await asyncio.gather(*(fetch_channel_chunk(chunk) for chunk in upstream_chunks(payloads)))
+
+    return json_response({"creators": payloads})
+
+async def get_dashboard_stats(request):
+    """
+    Enhanced endpoint specifically for dashboard with more detailed data
+    """
+    youtube_id = request.query_params.get('youtube_id')
+
+    if not youtube_id:
+        return json_response({"error": "Missing youtube_id"}, 400)
+
+    return json_response(dashboard_payload(await fetch_creator_payload(youtube_id)))
+
+async def export_snapshots(request):
+    """
+    Streams stored channel snapshots as a file. Reads local data only.
+    Accepts the same query parameters as the Flask /export endpoint.
+    """
+    if not snapshot_store:
+        return json_response({"error": "Snapshot storage is disabled"}, 503)
+
+    export_format = request.query_params.get('format', 'csv')
+    try:
+        chunks = iter_export(
+            snapshot_store,
+            export_format,
+            columns=parse_columns(request.query_params.get('columns')),
+            since=parse_timestamp(request.query_params.get('since')),
+            until=parse_timestamp(request.query_params.get('until')),
+            latest=request.query_params.get('latest', 'false').lower() in ('1', 'true', 'yes')
+        )
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+    except RuntimeError as e:
+        return json_response({"error": str(e)}, 501)
+
+    # Starlette iterates a sync generator in its threadpool, keeping the loop free
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MIMETYPES[export_format],
+        headers={"Content-Disposition": f"attachment; filename=snapshots.{export_format}"}
+    )
+
+async def not_found(request, exc):
+    return json_response({"error": "Endpoint not found", "available_endpoints": AVAILABLE_ENDPOINTS}, 404)
+
+async def internal_error(request, exc):
+    return json_response({"error": "Internal server error"}, 500)
+
+app = Starlette(
+    routes=[
+        Route('/', home),
+        Route('/health', health_check, methods=['GET']),
+        Route('/creator', get_creator_insights, methods=['GET']),
+        Route('/creators', get_creators_insights, methods=['GET']),
+        Route('/dashboard-stats', get_dashboard_stats, methods=['GET']),
+        Route('/export', export_snapshots, methods=['GET'])
+    ],
+    exception_handlers={
+        404: not_found,
+        500: internal_error
+    },
+    lifespan=lifespan
+)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    port = int(os.environ.get('PORT', 5000))
+    uvicorn.run(app, host='0.0.0.0', port=port)
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+# Async counterpart of hedging.py, kept separate so the Flask app never imports asyncio
+
+
+def _consume_outcome(task):
+    if not task.cancelled():
+        task.exception()
+
+
+async def async_hedged_get(policy, client, url, params=None, timeout=10):
+    """Async counterpart of `hedging.hedged_get` for an `httpx.AsyncClient`.
+
+    Unlike the threaded version, the losing attempt is cancelled outright.
+    """
+    async def attempt():
+        started = time.monotonic()
+        response = await client.get(url, params=params, timeout=timeout)
+        # Only completed attempts are sampled: a loser cancelled just after
+        # it started would otherwise drag the percentile towards zero
+        policy.latencies.record(time.monotonic() - started)
+        return response
+
+    tasks = [asyncio.ensure_future(attempt())]
+    try:
+        delay = policy.hedge_delay()
+        want_hedge = False
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            want_hedge = not done
+        if policy.record_call(want_hedge):
+            tasks.append(asyncio.ensure_future(attempt()))
+
+        error = None
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                if error is None or task is tasks[0]:
+                    error = task.exception()
+        raise error
+    finally:
+        # Also runs if our caller is cancelled (e.g. the client disconnected)
+        for task in tasks:
+            task.cancel()
+            # Collect the outcome so a failed loser is never reported as unretrieved
+            task.add_done_callback(_consume_outcome)
@@ -0,0 +1,241 @@
+import argparse
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+TEST_CHANNEL = "UC9gFih9rw0zNCK3ZtoKQQyA"
+
+# Ids the stub treats specially, to compare error handling between modes
+MISSING_CHANNEL = "UC_missing"
+NOT_JSON_CHANNEL = "UC_not_json"
+
+def stub_item(youtube_id):
+    """Canned channels.list item for one id"""
+    return {
+        "id": youtube_id,
+        "snippet": {
+            "title": f"Stub Channel {youtube_id}",
+            "description": "Sample channel served by the local benchmark stub."
+        },
+        "statistics": {
+            "subscriberCount": "19400000",
+            "videoCount": "250",
+            "viewCount": "1868223332"
+        }
+    }
+
+def make_stub_handler(latency):
+    class StubHandler(BaseHTTPRequestHandler):
+        """Pretends to be googleapis.com with a fixed injected latency"""
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            query = parse_qs(urlparse(self.path).query)
+            youtube_ids = query.get("id", [""])[0].split(",")
+            if NOT_JSON_CHANNEL in youtube_ids:
+                body = b"<html>upstream error page</html>"
+            else:
+                items = [stub_item(youtube_id) for youtube_id in youtube_ids if youtube_id != MISSING_CHANNEL]
+                body = json.dumps({"items": items}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 would drop connections under load
+    request_queue_size = 1024
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(command, port, env=None):
+    process = subprocess.Popen(
+        command,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except requests.exceptions.RequestException:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Server did not start: {' '.join(command)}")
+
+def run_load(base_url, total, concurrency, path="/creator", params=None):
+    """Fire `total` requests from `concurrency` threads"""
+    local = threading.local()
+    params = params or {"youtube_id": TEST_CHANNEL}
+
+    def one_request(_):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        started = time.perf_counter()
+        response = local.session.get(f"{base_url}{path}", params=params, timeout=300)
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(one_request, range(total)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "throughput": total / elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+def print_result(name, result):
+    print(f"   {name}")
+    print(f"      throughput: {result['throughput']:,.1f} req/s")
+    print(f"      p50: {result['p50'] * 1000:,.0f} ms   p99: {result['p99'] * 1000:,.0f} ms")
+
+def normalized_body(url, params=None):
+    """Response body with the per-request timestamp blanked out"""
+    body = requests.get(url, params=params, timeout=30).content
+    return re.sub(rb'"timestamp":"[^"]*"', b'"timestamp":""', body)
+
+BATCH = ",".join([TEST_CHANNEL, MISSING_CHANNEL] + [f"UC{i:04d}" for i in range(120)])
+
+RESPONSE_CHECKS = [
+    ("/", None),
+    ("/health", None),
+    ("/creator", {"youtube_id": TEST_CHANNEL}),
+    ("/creator", None),
+    ("/creator", {"youtube_id": MISSING_CHANNEL}),
+    ("/creator", {"youtube_id": NOT_JSON_CHANNEL}),
+    ("/creators", {"youtube_ids": BATCH}),
+    ("/creators", {"youtube_ids": f"{TEST_CHANNEL},{NOT_JSON_CHANNEL}"}),
+    ("/creators", None),
+    ("/dashboard-stats", {"youtube_id": TEST_CHANNEL}),
+    ("/does-not-exist", None),
+]
+
+# Checked against a second pair of servers whose upstream port is closed
+UNREACHABLE_CHECKS = [
+    ("/creator", {"youtube_id": TEST_CHANNEL}),
+    ("/creators", {"youtube_ids": BATCH}),
+    ("/dashboard-stats", {"youtube_id": TEST_CHANNEL}),
+]
+
+def compare_responses(sync_url, async_url, checks=RESPONSE_CHECKS):
+    all_match = True
+    for path, params in checks:
+        match = normalized_body(sync_url + path, params) == normalized_body(async_url + path, params)
+        all_match = all_match and match
+        label = path + ("?" + "&".join(f"{k}={v[:40]}" for k, v in params.items()) if params else "")
+        print(f"   {'✅' if match else '❌'} {label}")
+    return all_match
+
+def server_commands(sync_port, async_port, sync_workers):
+    return {
+        "sync (gunicorn + Flask)": (
+            [sys.executable, "-m", "gunicorn", "app:app", "-b", f"127.0.0.1:{sync_port}",
+             "-w", str(sync_workers)],
+            sync_port,
+        ),
+        "async (uvicorn + Starlette)": (
+            [sys.executable, "-m", "uvicorn", "asgi_app:app", "--port", str(async_port),
+             "--log-level", "warning"],
+            async_port,
+        ),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync (Flask) vs async (ASGI) serving")
+    parser.add_argument("--latency", type=float, default=0.2, help="Injected upstream latency in seconds")
+    parser.add_argument("--requests", type=int, default=200, help="Total /creator requests per server")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    # gunicorn rejects request lines over 4094 bytes, about 400 ids
+    parser.add_argument("--fanout-ids", type=int, default=300,
+                        help="Channel ids per /creators request in the fan-out run (50 per upstream call)")
+    parser.add_argument("--sync-workers", type=int, default=1,
+                        help="gunicorn sync workers for the Flask app (Procfile default: 1)")
+    args = parser.parse_args()
+
+    stub = StubServer(("127.0.0.1", 0), make_stub_handler(args.latency))
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+
+    os.environ.update({
+        "YOUTUBE_API_KEY": "benchmark",
+        "YOUTUBE_API_BASE_URL": f"http://127.0.0.1:{stub.server_port}",
+        "SNAPSHOT_DB_PATH": "",
+        "HEDGE_ENABLED": "false",
+    })
+
+    sync_port, async_port = free_port(), free_port()
+    servers = server_commands(sync_port, async_port, args.sync_workers)
+
+    print(f"🧪 Upstream latency {args.latency * 1000:.0f} ms, {args.concurrency} concurrent clients")
+    print()
+
+    processes = []
+    try:
+        for name, (command, port) in servers.items():
+            processes.append(start_server(command, port))
+
+        print("🔍 Comparing response bodies (timestamps ignored)...")
+        identical = compare_responses(f"http://127.0.0.1:{sync_port}", f"http://127.0.0.1:{async_port}")
+        print()
+
+        print("🔍 Comparing response bodies with the upstream unreachable...")
+        down_sync_port, down_async_port = free_port(), free_port()
+        down_env = {**os.environ, "YOUTUBE_API_BASE_URL": f"http://127.0.0.1:{free_port()}"}
+        for name, (command, port) in server_commands(down_sync_port, down_async_port, 1).items():
+            processes.append(start_server(command, port, down_env))
+        identical = compare_responses(
+            f"http://127.0.0.1:{down_sync_port}", f"http://127.0.0.1:{down_async_port}", UNREACHABLE_CHECKS
+        ) and identical
+        print()
+
+        print(f"📊 /creator, {args.requests} requests")
+        for name, (command, port) in servers.items():
+            print_result(name, run_load(f"http://127.0.0.1:{port}", args.requests, args.concurrency))
+        print()
+
+        fanout_ids = ",".join(f"UC{i:06d}" for i in range(args.fanout_ids))
+        fanout_requests = max(1, args.requests // 10)
+        print(f"📊 /creators fan-out, {args.fanout_ids} ids each, {fanout_requests} requests, one client")
+        for name, (command, port) in servers.items():
+            print_result(name, run_load(f"http://127.0.0.1:{port}", fanout_requests, 1,
+                                        path="/creators", params={"youtube_ids": fanout_ids}))
+        print()
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+        stub.shutdown()
+
+    if not identical:
+        print("⚠️  Responses differ between serving modes")
+        sys.exit(1)
+    print("✅ Done")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules loaded at process start by the API (gunicorn app:app) and the dashboard
+DEFAULT_TARGETS = ["app", "config", "dashboard"]
+
+def measure_import(module_name, runs=3):
+    """Import a module in a fresh interpreter with -X importtime.
+
+    Returns (best total in ms, {imported module: cumulative ms}, error text).
+    The best of several runs is kept to smooth out disk cache noise.
+    """
+    best_total = None
+    best_breakdown = {}
+    error = None
+
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+
+        breakdown = {}
+        other_lines = []
+        found = False
+        for line in result.stderr.splitlines():
+            # Format: "import time: self [us] | cumulative | imported package"
+            if not line.startswith("import time:") or "cumulative" in line:
+                other_lines.append(line)
+                continue
+            if found:
+                continue
+            _, cumulative, raw_name = line[len("import time:"):].split("|")
+            name = raw_name.strip()
+            breakdown[name] = int(cumulative) / 1000
+            if name == module_name:
+                found = True
+                continue
+            # Children are printed before their parent, so a new top-level
+            # entry means everything so far belonged to interpreter startup
+            if raw_name[1:2] != " ":
+                breakdown = {}
+
+        if result.returncode != 0:
+            error = "\n".join(other_lines[-3:]) or f"exit code {result.returncode}"
+            break
+
+        total = breakdown.get(module_name, 0.0)
+        if best_total is None or total < best_total:
+            best_total = total
+            best_breakdown = breakdown
+
+    return best_total, best_breakdown, error
+
+def top_level_costs(breakdown, module_name, limit):
+    """Largest top-level packages pulled in by the import"""
+    packages = {}
+    for name, cumulative in breakdown.items():
+        if name == module_name:
+            continue
+        root = name.split(".")[0]
+        packages[root] = max(packages.get(root, 0.0), cumulative)
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-module import cost")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_TARGETS,
+                        help="Modules to import (default: app config dashboard)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=8, help="Heaviest dependencies to list")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Exit non-zero if any module takes longer than this")
+    args = parser.parse_args()
+
+    print("⏱️  Measuring cold import times...")
+    print(f"Python version: {sys.version.split()[0]}")
+    print()
+
+    over_budget = []
+    for module_name in args.modules:
+        total, breakdown, error = measure_import(module_name, runs=args.runs)
+        if error:
+            print(f"❌ {module_name}: import failed")
+            print(f"   {error}")
+            over_budget.append(module_name)
+            continue
+
+        flag = ""
+        if args.budget_ms is not None and total > args.budget_ms:
+            flag = f"  ⚠️ over budget ({args.budget_ms:.0f} ms)"
+            over_budget.append(module_name)
+        print(f"📦 {module_name}: {total:,.1f} ms{flag}")
+
+        for name, cumulative in top_level_costs(breakdown, module_name, args.top):
+            print(f"   {name:<24} {cumulative:>10,.1f} ms")
+        print()
+
+    if over_budget:
+        print(f"⚠️  Startup regression in: {', '.join(over_budget)}")
+        sys.exit(1)
+    print("✅ Done")
+
+if __name__ == "__main__":
+    main()
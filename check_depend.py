@@ -24,9 +24,14 @@ def main():
         ("streamlit", "streamlit"),
         ("plotly", "plotly"),
         ("pandas", "pandas"),
+        ("numpy", "numpy"),
+        ("pyarrow", "pyarrow"),
         ("requests", "requests"),
         ("flask", "Flask"),
         ("dotenv", "python-dotenv"),
+        ("starlette", "starlette"),
+        ("httpx", "httpx"),
+        ("uvicorn", "uvicorn"),
     ]
     
     all_installed = True
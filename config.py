@@ -1,11 +1,11 @@
 import os
-import streamlit as st
 
-def get_api_base_url():
+def get_api_base_url(secrets=None):
+    """API URL from Streamlit secrets (pass `st.secrets`), the environment, or localhost"""
     try:
-        # First try to get from Streamlit secrets (production)
-        if hasattr(st, 'secrets') and 'general' in st.secrets and 'API_BASE_URL' in st.secrets.general:
-            return st.secrets.general.API_BASE_URL
+        # First try Streamlit secrets (production)
+        if secrets is not None and 'general' in secrets and 'API_BASE_URL' in secrets.general:
+            return secrets.general.API_BASE_URL
         # Then try environment variable
         elif os.environ.get('API_BASE_URL'):
             return os.environ.get('API_BASE_URL')
@@ -14,6 +14,4 @@ def get_api_base_url():
             return 'http://localhost:5000'
     except:
         # Fallback for any errors
-        return os.environ.get('API_BASE_URL', 'http://localhost:5000')
-
-API_BASE_URL = get_api_base_url()
\ No newline at end of file
+        return os.environ.get('API_BASE_URL', 'http://localhost:5000')
\ No newline at end of file
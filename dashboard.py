@@ -1,8 +1,6 @@
 import streamlit as st
 import requests
-import pandas as pd
-import plotly.graph_objects as go
-from config import API_BASE_URL
+from config import get_api_base_url
 import os
 
 # Page configuration
@@ -54,10 +52,37 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _graph_objects():
+    """Import plotly on first chart render instead of at script load"""
+    import plotly.graph_objects as go
+    return go
+
+@st.cache_resource
+def dark_chart_template():
+    """Plotly's default theme with dark overrides, built once per server process"""
+    go = _graph_objects()
+    import plotly.io as pio
+
+    # Copy so the shared default template is left untouched
+    template = go.layout.Template(pio.templates['plotly'])
+    axis_style = dict(
+        tickfont=dict(color='white'),
+        gridcolor='rgba(128,128,128,0.3)'
+    )
+    template.layout.update(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=axis_style,
+        yaxis=axis_style,
+        title_font=dict(color='white')
+    )
+    return template
+
 class CreatorDashboard:
     def __init__(self):
-        # Use the API_BASE_URL from config
-        self.api_base_url = API_BASE_URL
+        # Resolve the API URL from Streamlit secrets or the environment
+        self.api_base_url = get_api_base_url(st.secrets)
     
     def check_api_health(self):
         """Check if the API is running and healthy"""
@@ -95,6 +120,8 @@ class CreatorDashboard:
             return None
         
         yt_data = data['youtube_data']
+        # Derived metrics come precomputed from the API
+        derived = data.get('metrics', {})
         
         # Create columns for metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -124,10 +151,10 @@ class CreatorDashboard:
             )
         
         with col4:
-            avg_views = (views / videos) if videos > 0 else 0
+            views_per_video = derived.get('views_per_video', 0)
             st.metric(
                 label="📈 Avg Views/Video",
-                value=f"{avg_views:,.0f}",
+                value=f"{views_per_video:,.0f}",
                 help="Average views per video"
             )
         
@@ -135,7 +162,8 @@ class CreatorDashboard:
             'subscribers': subscribers,
             'videos': videos,
             'views': views,
-            'avg_views': avg_views
+            'views_per_subscriber': derived.get('views_per_subscriber', 0),
+            'views_per_video': views_per_video
         }
     
     def create_engagement_chart(self, metrics):
@@ -150,6 +178,7 @@ class CreatorDashboard:
         views = metrics.get('views', 0)
         
         # Create simple bar chart using plotly.graph_objects with dark theme
+        go = _graph_objects()
         fig = go.Figure()
         
         # Add bars for each metric
@@ -162,25 +191,14 @@ class CreatorDashboard:
             textfont=dict(color='white')
         ))
         
-        # Update layout with dark theme
+        # Apply the shared dark theme
         fig.update_layout(
+            template=dark_chart_template(),
             title='📊 Channel Engagement Metrics',
             showlegend=False,
             height=400,
             xaxis_title="",
-            yaxis_title="Count",
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            xaxis=dict(
-                tickfont=dict(color='white'),
-                gridcolor='rgba(128,128,128,0.3)'
-            ),
-            yaxis=dict(
-                tickfont=dict(color='white'),
-                gridcolor='rgba(128,128,128,0.3)'
-            ),
-            title_font=dict(color='white')
+            yaxis_title="Count"
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -191,15 +209,11 @@ class CreatorDashboard:
             st.error("No metrics data available for ratio chart")
             return
         
-        subscribers = metrics.get('subscribers', 1)
-        views = metrics.get('views', 0)
-        videos = metrics.get('videos', 1)
-        
-        # Calculate ratios
-        views_per_subscriber = views / subscribers if subscribers > 0 else 0
-        views_per_video = views / videos if videos > 0 else 0
+        views_per_subscriber = metrics.get('views_per_subscriber', 0)
+        views_per_video = metrics.get('views_per_video', 0)
         
         # Create simple bar chart with dark theme
+        go = _graph_objects()
         fig = go.Figure()
         
         # Add bars for ratios
@@ -212,25 +226,14 @@ class CreatorDashboard:
             textfont=dict(color='white')
         ))
         
-        # Update layout with dark theme
+        # Apply the shared dark theme
         fig.update_layout(
+            template=dark_chart_template(),
             title='📈 Engagement Ratios',
             showlegend=False,
             height=400,
             xaxis_title="",
-            yaxis_title="Ratio Value",
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            xaxis=dict(
-                tickfont=dict(color='white'),
-                gridcolor='rgba(128,128,128,0.3)'
-            ),
-            yaxis=dict(
-                tickfont=dict(color='white'),
-                gridcolor='rgba(128,128,128,0.3)'
-            ),
-            title_font=dict(color='white')
+            yaxis_title="Ratio Value"
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -364,6 +367,12 @@ def main():
                     "platforms": ["YouTube"],
                     "total_videos": 250,
                     "total_subscribers": 19400000
+                },
+                "metrics": {
+                    "views_per_subscriber": 96.30017175257731,
+                    "views_per_video": 7472893.328,
+                    "engagement_score": 100.0,
+                    "content_frequency_score": 2.5
                 }
             }
             
@@ -0,0 +1,160 @@
+import argparse
+import csv
+import io
+import os
+import sys
+from datetime import datetime
+
+from snapshots import SNAPSHOT_COLUMNS, SnapshotStore
+
+EXPORT_FORMATS = ('csv', 'parquet', 'arrow')
+
+# Column types for the columnar formats
+_COLUMN_TYPES = {
+    'youtube_id': 'string',
+    'fetched_at': 'string',
+    'channel_title': 'string',
+    'subscriber_count': 'int64',
+    'video_count': 'int64',
+    'view_count': 'int64',
+    'views_per_subscriber': 'float64',
+    'views_per_video': 'float64',
+    'engagement_score': 'float64',
+    'content_frequency_score': 'float64'
+}
+
+def parse_columns(value):
+    """Turn a comma separated column list into a tuple, defaulting to all columns"""
+    if not value:
+        return SNAPSHOT_COLUMNS
+    columns = tuple(column.strip() for column in value.split(',') if column.strip())
+    if not columns:
+        raise ValueError("No columns selected")
+    unknown = [column for column in columns if column not in SNAPSHOT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    return columns
+
+def parse_timestamp(value):
+    """Normalize an ISO date or datetime so it compares with stored timestamps.
+
+    Snapshots are stamped with naive local time (`datetime.now()`), so
+    values with a UTC offset are converted to naive local time first.
+    """
+    if not value:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid ISO timestamp: {value}")
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return timestamp.isoformat()
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("pyarrow is required for parquet and arrow exports. Run: pip install pyarrow")
+    return pyarrow
+
+def _drain(sink):
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+def iter_csv(batches, columns):
+    """Yield CSV bytes, one chunk per batch of rows"""
+    sink = io.StringIO()
+    writer = csv.writer(sink)
+    writer.writerow(columns)
+    yield _drain(sink).encode('utf-8')
+    for rows in batches:
+        writer.writerows(rows)
+        yield _drain(sink).encode('utf-8')
+
+def iter_columnar(batches, columns, export_format):
+    """Yield Parquet or Arrow IPC stream bytes, one chunk per batch of rows"""
+    pa = _require_pyarrow()
+    schema = pa.schema([(column, _COLUMN_TYPES[column]) for column in columns])
+    sink = io.BytesIO()
+    if export_format == 'parquet':
+        writer = pa.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    for rows in batches:
+        arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        yield _drain(sink)
+
+    # Parquet writes its footer (and Arrow its end-of-stream marker) on close
+    writer.close()
+    yield _drain(sink)
+
+def iter_export(store, export_format='csv', columns=SNAPSHOT_COLUMNS, since=None, until=None,
+                latest=False, batch_size=50000):
+    """Stream stored snapshots as bytes in the requested format.
+
+    Rows are read and encoded `batch_size` at a time, so memory stays
+    bounded regardless of the table size. Nothing is fetched upstream.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}")
+    if export_format != 'csv':
+        _require_pyarrow()
+
+    batches = store.iter_batches(columns, since=since, until=until, latest=latest,
+                                 batch_size=batch_size)
+    if export_format == 'csv':
+        return iter_csv(batches, columns)
+    return iter_columnar(batches, columns, export_format)
+
+def main():
+    parser = argparse.ArgumentParser(description="Export stored channel snapshots")
+    parser.add_argument("output", help="Output file path, or - for stdout")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default=None,
+                        help="Output format (default: from the file extension, else csv)")
+    parser.add_argument("--db", default=os.environ.get('SNAPSHOT_DB_PATH') or 'snapshots.db',
+                        help="Snapshot database (default: SNAPSHOT_DB_PATH or snapshots.db)")
+    parser.add_argument("--columns", default=None,
+                        help=f"Comma separated columns (default: all of {', '.join(SNAPSHOT_COLUMNS)})")
+    parser.add_argument("--since", default=None, help="Only snapshots fetched at or after this ISO time")
+    parser.add_argument("--until", default=None, help="Only snapshots fetched before this ISO time")
+    parser.add_argument("--latest", action="store_true", help="Only the newest snapshot per channel")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Rows read and written per batch")
+    args = parser.parse_args()
+
+    export_format = args.format
+    if export_format is None:
+        extension = os.path.splitext(args.output)[1].lstrip('.').lower()
+        export_format = extension if extension in EXPORT_FORMATS else 'csv'
+
+    if not os.path.exists(args.db):
+        parser.error(f"Snapshot database not found: {args.db}")
+
+    try:
+        chunks = iter_export(
+            SnapshotStore(args.db),
+            export_format,
+            columns=parse_columns(args.columns),
+            since=parse_timestamp(args.since),
+            until=parse_timestamp(args.until),
+            latest=args.latest,
+            batch_size=args.batch_size
+        )
+    except (ValueError, RuntimeError) as e:
+        parser.error(str(e))
+
+    output = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+if __name__ == "__main__":
+    main()
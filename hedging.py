@@ -0,0 +1,157 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import requests
+
+
+class LatencyHistogram:
+    """Rolling histogram over the most recent upstream latencies.
+
+    Latencies (in seconds) fall into geometric buckets, so percentiles cost
+    one pass over a few dozen counters instead of sorting raw samples.
+    Only the last `window` samples are counted.
+    """
+
+    def __init__(self, window=500, min_latency=0.01, max_latency=30.0, growth=1.2):
+        self.window = window
+        self._bounds = []
+        bound = min_latency
+        while bound < max_latency:
+            self._bounds.append(bound)
+            bound *= growth
+        self._bounds.append(max_latency)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._samples = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, seconds):
+        bucket = bisect_left(self._bounds, seconds)
+        with self._lock:
+            self._samples.append(bucket)
+            self._counts[bucket] += 1
+            if len(self._samples) > self.window:
+                self._counts[self._samples.popleft()] -= 1
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th percentile, or None if empty"""
+        with self._lock:
+            total = len(self._samples)
+            if total == 0:
+                return None
+            rank = total * pct / 100.0
+            seen = 0
+            for bucket, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank and count:
+                    break
+        if bucket >= len(self._bounds):
+            return self._bounds[-1]
+        return self._bounds[bucket]
+
+
+class HedgePolicy:
+    """Decides when to send a duplicate upstream request and how often.
+
+    A hedge is sent once the first attempt has been outstanding longer than
+    `percentile` of recent latencies. At most `max_hedge_fraction` of the
+    last `window` calls may be hedged, so a slow upstream cannot double our
+    YouTube quota usage.
+    """
+
+    def __init__(self, percentile=95.0, max_hedge_fraction=0.05, min_samples=20,
+                 min_delay=0.05, window=500):
+        self.percentile = percentile
+        self.max_hedge_fraction = max_hedge_fraction
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latencies = LatencyHistogram(window=window)
+        self._calls = deque(maxlen=window)
+        self._hedged = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self):
+        """Seconds to wait before hedging, or None until enough samples exist"""
+        if len(self.latencies) < self.min_samples:
+            return None
+        return max(self.min_delay, self.latencies.percentile(self.percentile))
+
+    def record_call(self, want_hedge):
+        """Record a call and return whether it is allowed to hedge"""
+        with self._lock:
+            if len(self._calls) == self._calls.maxlen and self._calls[0]:
+                self._hedged -= 1
+            calls = len(self._calls) + 1
+            allowed = want_hedge and (self._hedged + 1) / calls <= self.max_hedge_fraction
+            self._calls.append(allowed)
+            if allowed:
+                self._hedged += 1
+            return allowed
+
+
+# Sized so abandoned losers waiting on headers don't starve new calls
+_executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="upstream")
+
+
+def _attempt(policy, url, params, timeout, cancelled, submitted):
+    response = requests.get(url, params=params, timeout=timeout, stream=True)
+    # requests cannot interrupt a blocked socket read, so a losing attempt
+    # is abandoned here: drop the connection without reading the body.
+    # Its time to headers still counts, so slow tails stay visible.
+    if cancelled.is_set():
+        policy.latencies.record(time.monotonic() - submitted)
+        response.close()
+        return None
+    response.content  # read the body so the sample covers the full transfer
+    # Timed from submission so executor queueing shows up in the histogram
+    policy.latencies.record(time.monotonic() - submitted)
+    return response
+
+
+def _close_loser(future):
+    if not future.cancelled() and future.exception() is None and future.result() is not None:
+        future.result().close()
+
+
+def hedged_get(policy, url, params=None, timeout=10):
+    """GET `url`, sending one duplicate request if the first one is slow.
+
+    Returns whichever response arrives first. Raises the first attempt's
+    exception if every attempt fails, like `requests.get` would.
+    """
+    delay = policy.hedge_delay()
+    if delay is None:
+        # Not enough samples to hedge yet: call inline, just collect timings
+        policy.record_call(False)
+        started = time.monotonic()
+        response = requests.get(url, params=params, timeout=timeout)
+        policy.latencies.record(time.monotonic() - started)
+        return response
+
+    cancelled = threading.Event()
+    futures = [_executor.submit(_attempt, policy, url, params, timeout, cancelled, time.monotonic())]
+
+    done, _ = wait(futures, timeout=delay)
+    if policy.record_call(not done):
+        futures.append(_executor.submit(_attempt, policy, url, params, timeout, cancelled, time.monotonic()))
+
+    error = None
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                cancelled.set()
+                # Close losers that finish later, or finished alongside the winner
+                for other in pending | (done - {future}):
+                    other.cancel()
+                    other.add_done_callback(_close_loser)
+                return future.result()
+            if error is None or future is futures[0]:
+                error = future.exception()
+    raise error
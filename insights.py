@@ -0,0 +1,215 @@
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from hedging import HedgePolicy
+from metrics import compute_metrics_batch
+from snapshots import SnapshotStore
+
+# Configuration and payload building shared by the Flask app (app.py) and
+# the async app (asgi_app.py), so both serve identical responses.
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Get API key from environment variable
+YOUTUBE_API_KEY = os.environ.get('YOUTUBE_API_KEY')
+
+# Overridable so benchmarks can point at a local stub server
+YOUTUBE_API_BASE_URL = os.environ.get('YOUTUBE_API_BASE_URL', 'https://www.googleapis.com/youtube/v3')
+YOUTUBE_CHANNELS_URL = f"{YOUTUBE_API_BASE_URL}/channels"
+
+# Optional request hedging: send one duplicate YouTube request when the first
+# is slower than HEDGE_PERCENTILE of recent latencies, for at most
+# HEDGE_MAX_FRACTION of calls
+HEDGE_ENABLED = os.environ.get('HEDGE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+hedge_policy = HedgePolicy(
+    percentile=float(os.environ.get('HEDGE_PERCENTILE', 95)),
+    max_hedge_fraction=float(os.environ.get('HEDGE_MAX_FRACTION', 0.05))
+)
+# Multi-id /creators calls are slower than single-id ones, so they keep
+# their own latency history instead of skewing hedge_policy
+batch_hedge_policy = HedgePolicy(
+    percentile=float(os.environ.get('HEDGE_PERCENTILE', 95)),
+    max_hedge_fraction=float(os.environ.get('HEDGE_MAX_FRACTION', 0.05))
+)
+
+# Every successful fetch is stored with its derived metrics. Set
+# SNAPSHOT_DB_PATH to an empty string to disable.
+SNAPSHOT_DB_PATH = os.environ.get('SNAPSHOT_DB_PATH', 'snapshots.db')
+snapshot_store = SnapshotStore(SNAPSHOT_DB_PATH) if SNAPSHOT_DB_PATH else None
+
+AVAILABLE_ENDPOINTS = ["/", "/health", "/creator", "/creators", "/dashboard-stats", "/export"]
+
+# channels.list accepts up to 50 ids per call; /creators fans out over chunks
+YOUTUBE_MAX_IDS_PER_CALL = 50
+MAX_BATCH_IDS = 500
+
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.stream'
+}
+
+def home_payload():
+    """Home page with API information"""
+    return {
+        "message": "Creator Insight API is running!",
+        "status": "healthy",
+        "version": "1.0.0",
+        "endpoints": {
+            "health": "/health",
+            "creator_data": "/creator?youtube_id=CHANNEL_ID",
+            "creators_data": "/creators?youtube_ids=CHANNEL_ID,CHANNEL_ID",
+            "export": "/export?format=csv"
+        },
+        "documentation": "Visit /creator?youtube_id=UC9gFih9rw0zNCK3ZtoKQQyA for example usage"
+    }
+
+def health_payload():
+    """Simple health check payload"""
+    return {
+        "status": "healthy",
+        "service": "Creator Insight API",
+        "timestamp": datetime.now().isoformat()
+    }
+
+def new_creator_payload(youtube_id):
+    """Empty /creator response, filled in by apply_youtube_response"""
+    aggregated_data = {
+        "requested_youtube_id": youtube_id,
+        "youtube_data": {},
+        "summary": {},
+        "status": "success",
+        "timestamp": datetime.now().isoformat()
+    }
+
+    # Check if we have an API key
+    if not YOUTUBE_API_KEY:
+        aggregated_data["youtube_data"] = {"error": "YouTube API key not configured"}
+        aggregated_data["status"] = "partial"
+
+    return aggregated_data
+
+def youtube_params(youtube_id):
+    return {
+        'part': 'statistics,snippet',
+        'id': youtube_id,
+        'key': YOUTUBE_API_KEY
+    }
+
+def parse_youtube_ids(value):
+    """Comma separated channel ids, de-duplicated in request order"""
+    youtube_ids = list(dict.fromkeys(youtube_id.strip() for youtube_id in (value or '').split(',') if youtube_id.strip()))
+    if not youtube_ids:
+        raise ValueError("Missing required parameter 'youtube_ids'")
+    if len(youtube_ids) > MAX_BATCH_IDS:
+        raise ValueError(f"At most {MAX_BATCH_IDS} youtube_ids per request")
+    return youtube_ids
+
+def upstream_chunks(items):
+    """Split per-channel items into groups that fit in one channels.list call"""
+    return [items[i:i + YOUTUBE_MAX_IDS_PER_CALL] for i in range(0, len(items), YOUTUBE_MAX_IDS_PER_CALL)]
+
+def channel_youtube_data(channel_data):
+    """The youtube_data section for one channels.list item"""
+    return {
+        "channel_title": channel_data['snippet']['title'],
+        "description": channel_data['snippet']['description'][:200] + "..." if len(channel_data['snippet']['description']) > 200 else channel_data['snippet']['description'],
+        "subscriber_count": int(channel_data['statistics'].get('subscriberCount', 0)),
+        "video_count": int(channel_data['statistics'].get('videoCount', 0)),
+        "view_count": int(channel_data['statistics'].get('viewCount', 0))
+    }
+
+def apply_channel_items(matches):
+    """Fill /creator payloads from (payload, channels.list item) pairs.
+
+    Metrics for all pairs are computed in one NumPy pass and the snapshots
+    are stored in one transaction.
+    """
+    records = [channel_youtube_data(channel_data) for _, channel_data in matches]
+    # Derived metrics are computed once here and served with the data
+    for (aggregated_data, _), youtube_data, metrics in zip(matches, records, compute_metrics_batch(records)):
+        aggregated_data['youtube_data'] = youtube_data
+
+        # Build a simple summary
+        aggregated_data['summary'] = {
+            "platforms": ['YouTube'],
+            "total_videos": youtube_data['video_count'],
+            "total_subscribers": youtube_data['subscriber_count']
+        }
+
+        aggregated_data['metrics'] = metrics
+
+    if snapshot_store:
+        try:
+            snapshot_store.record_many(
+                (
+                    aggregated_data['requested_youtube_id'],
+                    aggregated_data['timestamp'],
+                    aggregated_data['youtube_data'],
+                    aggregated_data['metrics']
+                )
+                for aggregated_data, _ in matches
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to store snapshots: {e}")
+
+def apply_channel_item(aggregated_data, channel_data):
+    """Fill a /creator payload from one channels.list item"""
+    apply_channel_items([(aggregated_data, channel_data)])
+    return aggregated_data
+
+def apply_youtube_response(aggregated_data, status_code, youtube_data):
+    """Parse a YouTube channels response into the /creator payload"""
+    # Check if we got a successful response
+    if status_code != 200:
+        return apply_fetch_error(
+            aggregated_data,
+            f"YouTube API returned error: {youtube_data.get('error', {}).get('message', 'Unknown error')}"
+        )
+
+    # PARSE & TRANSFORM the data
+    if youtube_data.get('items'):
+        return apply_channel_item(aggregated_data, youtube_data['items'][0])
+
+    return apply_fetch_error(aggregated_data, "No channel found with this ID")
+
+def apply_batch_response(payloads, status_code, youtube_data):
+    """Parse one multi-id channels response into the payloads of its ids"""
+    if status_code != 200:
+        for aggregated_data in payloads:
+            apply_youtube_response(aggregated_data, status_code, youtube_data)
+        return payloads
+
+    # Items come back in no particular order, and unknown ids are omitted
+    items = {item.get('id'): item for item in youtube_data.get('items', [])}
+    matches = []
+    for aggregated_data in payloads:
+        channel_data = items.get(aggregated_data['requested_youtube_id'])
+        if channel_data:
+            matches.append((aggregated_data, channel_data))
+        else:
+            apply_fetch_error(aggregated_data, "No channel found with this ID")
+    if matches:
+        apply_channel_items(matches)
+    return payloads
+
+def apply_fetch_error(aggregated_data, message):
+    aggregated_data["youtube_data"] = {"error": message}
+    aggregated_data["status"] = "error"
+    return aggregated_data
+
+def dashboard_payload(basic_data):
+    """Expose the precomputed metrics under the dashboard key"""
+    if basic_data.get('status') == 'success' and basic_data.get('metrics'):
+        return {
+            **basic_data,
+            "dashboard_metrics": basic_data['metrics']
+        }
+    return basic_data
@@ -0,0 +1,46 @@
+# Derived channel metrics. This is the single place these rules live: the API
+# serves them with every snapshot and the dashboard only displays them.
+# numpy is imported on first use to keep API startup lean.
+
+METRIC_NAMES = (
+    'views_per_subscriber',
+    'views_per_video',
+    'engagement_score',
+    'content_frequency_score'
+)
+
+def compute_metrics_arrays(subscribers, views, videos):
+    """Vectorized metrics over equal-length arrays of raw channel stats"""
+    import numpy as np
+
+    subscribers = np.asarray(subscribers, dtype=np.float64)
+    views = np.asarray(views, dtype=np.float64)
+    videos = np.asarray(videos, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        views_per_subscriber = np.where(subscribers > 0, views / subscribers, 0.0)
+        views_per_video = np.where(videos > 0, views / videos, 0.0)
+
+    return {
+        'views_per_subscriber': views_per_subscriber,
+        'views_per_video': views_per_video,
+        'engagement_score': np.minimum(100.0, (subscribers / np.maximum(1.0, views)) * 100000),
+        'content_frequency_score': np.minimum(100.0, videos / 100)
+    }
+
+def compute_metrics_batch(records):
+    """Metrics for a list of `youtube_data` dicts in one NumPy pass"""
+    import numpy as np
+
+    count = len(records)
+    columns = compute_metrics_arrays(
+        np.fromiter((r.get('subscriber_count', 0) for r in records), dtype=np.float64, count=count),
+        np.fromiter((r.get('view_count', 0) for r in records), dtype=np.float64, count=count),
+        np.fromiter((r.get('video_count', 0) for r in records), dtype=np.float64, count=count)
+    )
+    values = [columns[name].tolist() for name in METRIC_NAMES]
+    return [dict(zip(METRIC_NAMES, row)) for row in zip(*values)]
+
+def compute_metrics(record):
+    """Metrics for a single `youtube_data` dict"""
+    return compute_metrics_batch([record])[0]
@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+from contextlib import closing
+
+from metrics import METRIC_NAMES
+
+# Raw stats and their derived metrics are stored side by side, one row per fetch
+SNAPSHOT_COLUMNS = (
+    'youtube_id',
+    'fetched_at',
+    'channel_title',
+    'subscriber_count',
+    'video_count',
+    'view_count'
+) + METRIC_NAMES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    youtube_id TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    channel_title TEXT,
+    subscriber_count INTEGER,
+    video_count INTEGER,
+    view_count INTEGER,
+    views_per_subscriber REAL,
+    views_per_video REAL,
+    engagement_score REAL,
+    content_frequency_score REAL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_channel ON snapshots (youtube_id, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots (fetched_at);
+"""
+
+class SnapshotStore:
+    """SQLite store of channel snapshots fetched by the API.
+
+    The database is opened and its schema created on first use, so
+    importing the app never touches the disk and a read-only filesystem
+    only costs failed writes, not a failed startup.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._ready = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def connect(self):
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    with closing(sqlite3.connect(self.path, timeout=5)) as conn:
+                        conn.execute('PRAGMA journal_mode=WAL')
+                        conn.executescript(_SCHEMA)
+                    self._ready = True
+        # Export generators may be resumed from different worker threads;
+        # each connection is still used by one caller at a time
+        return sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+
+    def _writer(self):
+        """This thread's write connection, opened once and then reused"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self.connect()
+        return conn
+
+    def record(self, youtube_id, fetched_at, youtube_data, metrics):
+        """Store one snapshot of raw stats plus its derived metrics"""
+        self.record_many([(youtube_id, fetched_at, youtube_data, metrics)])
+
+    def record_many(self, rows):
+        """Store (youtube_id, fetched_at, youtube_data, metrics) rows in one transaction"""
+        values = [
+            (
+                youtube_id,
+                fetched_at,
+                youtube_data.get('channel_title'),
+                youtube_data.get('subscriber_count', 0),
+                youtube_data.get('video_count', 0),
+                youtube_data.get('view_count', 0)
+            ) + tuple(metrics[name] for name in METRIC_NAMES)
+            for youtube_id, fetched_at, youtube_data, metrics in rows
+        ]
+        if not values:
+            return
+        placeholders = ', '.join('?' for _ in SNAPSHOT_COLUMNS)
+        with self._writer() as conn:
+            conn.executemany(
+                f"INSERT INTO snapshots ({', '.join(SNAPSHOT_COLUMNS)}) VALUES ({placeholders})",
+                values
+            )
+
+    def iter_batches(self, columns=SNAPSHOT_COLUMNS, since=None, until=None, latest=False,
+                     batch_size=50000):
+        """Iterate snapshot rows as lists of tuples, `batch_size` rows at a time.
+
+        `since` is inclusive and `until` exclusive (ISO timestamps). With
+        `latest`, only the newest snapshot per channel in the range is kept.
+        """
+        unknown = [column for column in columns if column not in SNAPSHOT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        conditions = []
+        params = []
+        if since:
+            conditions.append('fetched_at >= ?')
+            params.append(since)
+        if until:
+            conditions.append('fetched_at < ?')
+            params.append(until)
+        where = ' AND '.join(conditions) or '1'
+
+        if latest:
+            query = (
+                f"SELECT {', '.join(columns)} FROM snapshots AS s WHERE {where} "
+                f"AND fetched_at = (SELECT MAX(fetched_at) FROM snapshots "
+                f"WHERE youtube_id = s.youtube_id AND {where}) "
+                f"ORDER BY youtube_id"
+            )
+            params = params * 2
+        else:
+            query = f"SELECT {', '.join(columns)} FROM snapshots WHERE {where} ORDER BY fetched_at"
+
+        # Connect and run the query now, so errors surface before streaming starts
+        conn = self.connect()
+        try:
+            cursor = conn.execute(query, params)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return self._fetch_batches(conn, cursor, batch_size)
+
+    def _fetch_batches(self, conn, cursor, batch_size):
+        with closing(conn):
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
@@ -0,0 +1,130 @@
+import io
+import os
+import time
+
+import pytest
+
+from export import iter_export, parse_columns, parse_timestamp
+from snapshots import SNAPSHOT_COLUMNS, SnapshotStore
+
+METRICS = {
+    'views_per_subscriber': 1.0,
+    'views_per_video': 10.0,
+    'engagement_score': 50.0,
+    'content_frequency_score': 1.0
+}
+
+SNAPSHOTS = [
+    ('UC_a', '2026-01-01T00:00:00', 100),
+    ('UC_b', '2026-01-01T12:00:00', 200),
+    ('UC_a', '2026-01-02T00:00:00', 110),
+    ('UC_b', '2026-01-02T12:00:00', 210),
+    ('UC_a', '2026-01-03T00:00:00', 120),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'snapshots.db'))
+    store.record_many(
+        (youtube_id, fetched_at, {'channel_title': youtube_id, 'view_count': views}, METRICS)
+        for youtube_id, fetched_at, views in SNAPSHOTS
+    )
+    return store
+
+
+@pytest.fixture
+def local_timezone():
+    """Run with a fixed local timezone (UTC+05:30, no DST)"""
+    previous = os.environ.get('TZ')
+    os.environ['TZ'] = 'Asia/Kolkata'
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = previous
+    time.tzset()
+
+
+def rows(store, **kwargs):
+    return [row for batch in store.iter_batches(**kwargs) for row in batch]
+
+
+def test_since_is_inclusive_and_until_exclusive(store):
+    fetched = rows(store, columns=('fetched_at',), since='2026-01-01T12:00:00', until='2026-01-03T00:00:00')
+
+    assert fetched == [('2026-01-01T12:00:00',), ('2026-01-02T00:00:00',), ('2026-01-02T12:00:00',)]
+
+
+def test_latest_returns_newest_row_per_channel(store):
+    latest = rows(store, columns=('youtube_id', 'view_count'), latest=True)
+
+    assert latest == [('UC_a', 120), ('UC_b', 210)]
+
+
+def test_latest_applies_the_time_range(store):
+    latest = rows(store, columns=('youtube_id', 'view_count'), latest=True,
+                  since='2026-01-01T06:00:00', until='2026-01-02T06:00:00')
+
+    assert latest == [('UC_a', 110), ('UC_b', 200)]
+
+
+def test_rows_come_in_batches(store):
+    batches = list(store.iter_batches(columns=('view_count',), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_parse_columns():
+    assert parse_columns(None) == SNAPSHOT_COLUMNS
+    assert parse_columns(' youtube_id, view_count ') == ('youtube_id', 'view_count')
+
+    with pytest.raises(ValueError, match="No columns selected"):
+        parse_columns(',')
+    with pytest.raises(ValueError, match="Unknown columns: secret"):
+        parse_columns('youtube_id,secret')
+
+
+def test_parse_timestamp():
+    assert parse_timestamp(None) is None
+    assert parse_timestamp('2026-01-02') == '2026-01-02T00:00:00'
+    assert parse_timestamp('2026-01-02T03:04:05') == '2026-01-02T03:04:05'
+
+    with pytest.raises(ValueError, match="Invalid ISO timestamp"):
+        parse_timestamp('yesterday')
+
+
+def test_parse_timestamp_converts_offsets_to_local_time(local_timezone):
+    assert parse_timestamp('2026-01-02T00:00:00+00:00') == '2026-01-02T05:30:00'
+    assert parse_timestamp('2026-01-02T00:00:00-01:00') == '2026-01-02T06:30:00'
+
+
+def test_csv_export(store):
+    data = b''.join(iter_export(store, 'csv', columns=('youtube_id', 'view_count'), latest=True))
+
+    assert data.decode('utf-8').splitlines() == ['youtube_id,view_count', 'UC_a,120', 'UC_b,210']
+
+
+def test_unsupported_format(store):
+    with pytest.raises(ValueError, match="Unsupported format 'zip'"):
+        iter_export(store, 'zip')
+
+
+@pytest.mark.parametrize('export_format', ['parquet', 'arrow'])
+def test_columnar_export_round_trips(store, export_format):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet
+
+    columns = ('youtube_id', 'fetched_at', 'view_count', 'engagement_score')
+    data = b''.join(iter_export(store, export_format, columns=columns, batch_size=2))
+
+    if export_format == 'parquet':
+        table = pa.parquet.read_table(io.BytesIO(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+
+    assert table.column_names == list(columns)
+    assert table.schema.field('view_count').type == pa.int64()
+    assert table.column('view_count').to_pylist() == [views for _, _, views in SNAPSHOTS]
+    assert table.column('engagement_score').to_pylist() == [50.0] * len(SNAPSHOTS)
@@ -0,0 +1,100 @@
+import asyncio
+
+from async_hedging import async_hedged_get
+from hedging import HedgePolicy, LatencyHistogram
+
+
+def test_percentile_returns_bucket_upper_bound():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.02)
+    for _ in range(10):
+        histogram.record(1.0)
+
+    assert 0.02 <= histogram.percentile(50) < 0.03
+    assert 0.02 <= histogram.percentile(90) < 0.03
+    assert 1.0 <= histogram.percentile(99) < 1.25
+
+
+def test_percentile_is_none_when_empty():
+    assert LatencyHistogram().percentile(95) is None
+
+
+def test_histogram_only_counts_the_window():
+    histogram = LatencyHistogram(window=10)
+    for _ in range(10):
+        histogram.record(5.0)
+    for _ in range(10):
+        histogram.record(0.02)
+
+    assert len(histogram) == 10
+    assert histogram.percentile(100) < 0.03
+
+
+def test_latencies_beyond_range_clamp_to_max():
+    histogram = LatencyHistogram(max_latency=30.0)
+    histogram.record(120.0)
+
+    assert histogram.percentile(50) == 30.0
+
+
+def test_no_hedge_delay_until_min_samples():
+    policy = HedgePolicy(min_samples=5)
+    for _ in range(4):
+        policy.latencies.record(0.2)
+    assert policy.hedge_delay() is None
+
+    policy.latencies.record(0.2)
+    assert policy.hedge_delay() >= 0.2
+
+
+def test_hedge_delay_has_floor():
+    policy = HedgePolicy(min_samples=1, min_delay=0.05)
+    policy.latencies.record(0.001)
+
+    assert policy.hedge_delay() == 0.05
+
+
+def test_record_call_caps_hedged_fraction():
+    policy = HedgePolicy(max_hedge_fraction=0.05, window=100)
+
+    allowed = [policy.record_call(True) for _ in range(100)]
+
+    assert sum(allowed) == 5
+    assert not allowed[0]  # 1 of 1 would already be 100%
+
+
+def test_record_call_never_hedges_unwanted_calls():
+    policy = HedgePolicy(max_hedge_fraction=1.0)
+
+    assert not policy.record_call(False)
+    assert policy.record_call(True)
+
+
+def test_record_call_frees_budget_as_window_rolls():
+    policy = HedgePolicy(max_hedge_fraction=0.5, window=4)
+    assert [policy.record_call(True) for _ in range(4)] == [False, True, False, True]
+
+    # The oldest (unhedged) call leaves the window as each new one arrives
+    assert not policy.record_call(True)
+    assert policy.record_call(True)
+
+
+def test_cancelled_hedge_is_not_sampled():
+    policy = HedgePolicy(min_samples=1, min_delay=0.01, max_hedge_fraction=1.0)
+    policy.latencies.record(0.01)
+
+    class SlowHedgeClient:
+        calls = 0
+
+        async def get(self, url, params=None, timeout=None):
+            self.calls += 1
+            attempt = self.calls
+            # The first attempt wins shortly after the hedge starts
+            await asyncio.sleep(0.05 if attempt == 1 else 1.0)
+            return attempt
+
+    client = SlowHedgeClient()
+    assert asyncio.run(async_hedged_get(policy, client, "http://upstream/")) == 1
+    assert client.calls == 2
+    assert len(policy.latencies) == 2  # the seed plus the winner only
@@ -0,0 +1,67 @@
+import pytest
+
+from metrics import METRIC_NAMES, compute_metrics, compute_metrics_batch
+
+
+def channel(subscribers, videos, views):
+    return {'subscriber_count': subscribers, 'video_count': videos, 'view_count': views}
+
+
+def test_zero_stats_give_zero_metrics():
+    metrics = compute_metrics(channel(0, 0, 0))
+
+    assert metrics == {name: 0.0 for name in METRIC_NAMES}
+
+
+def test_missing_stats_count_as_zero():
+    assert compute_metrics({}) == compute_metrics(channel(0, 0, 0))
+
+
+def test_ratios():
+    metrics = compute_metrics(channel(1000, 20, 50000))
+
+    assert metrics['views_per_subscriber'] == 50.0
+    assert metrics['views_per_video'] == 2500.0
+    assert metrics['engagement_score'] == 100.0  # 2000 before the cap
+    assert metrics['content_frequency_score'] == 0.2
+
+
+def test_zero_views_use_one_for_engagement():
+    assert compute_metrics(channel(1, 0, 0))['engagement_score'] == 100.0
+    assert compute_metrics(channel(0, 5, 0))['engagement_score'] == 0.0
+
+
+def test_scores_are_capped_at_100():
+    metrics = compute_metrics(channel(19400000, 25000, 1868223332))
+
+    assert metrics['engagement_score'] == 100.0
+    assert metrics['content_frequency_score'] == 100.0
+
+
+def test_uncapped_scores():
+    metrics = compute_metrics(channel(10, 250, 1000000))
+
+    assert metrics['engagement_score'] == pytest.approx(1.0)
+    assert metrics['content_frequency_score'] == 2.5
+
+
+def test_batch_matches_single_records():
+    records = [
+        channel(0, 0, 0),
+        channel(1000, 20, 50000),
+        channel(19400000, 250, 1868223332),
+        channel(10, 250, 1000000),
+        {},
+    ]
+
+    assert compute_metrics_batch(records) == [compute_metrics(record) for record in records]
+
+
+def test_batch_values_are_plain_floats():
+    metrics = compute_metrics_batch([channel(3, 7, 11)])[0]
+
+    assert all(type(value) is float for value in metrics.values())
+
+
+def test_empty_batch():
+    assert compute_metrics_batch([]) == []